@@ -3,57 +3,15 @@
 """Scraps data from the isaac API doc and copies it in the target file.
 The script takes in argument the path to the Afterbirth API docs."""
 
-import re
 import os
 import os.path as pth
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
-    Iterator, Tuple, List, Match, cast,
-    Optional, Union, NamedTuple, IO, Callable )
+    Iterator, Tuple, List, Dict, Match, Optional, BinaryIO )
 
 from scraper_regexs import *
 
-def tryMatch(x: Match, prop: str) -> bool:
-    """Convinience function to test existance of a group in match object"""
-    try:
-        return x.group(prop) is not None
-    except (IndexError, AttributeError):
-        return False
-
-def tryMatchNone(x: Optional[Match], prop: str) -> Optional[str]:
-    """Convinience function to test existance of a group in an U[Match,None]."""
-    if x is None:
-        return None
-    else:
-        return x.group(prop)
-
-def tryMatchString(x: Optional[Match], prop: str) -> str:
-    """Like tryMatchNone but returns '' instead of None"""
-    if x is None:
-        return ''
-    else:
-        ret = x.group(prop)
-        return ret if ret is not None else ''
-
-
-class InvalidRematcher(Exception):
-    """Rose when trying to create an object from an invalid matcher."""
-    def __init__(self,
-                 msg: str= 'Couldn\'t construct Class from matcher') -> None:
-        super().__init__()
-        self.message = msg
-
-class InvalidFunctionRematcher(InvalidRematcher):
-    def __init__(self,
-                 msg: str= 'Couldn\'t construct function form line') -> None:
-        super().__init__()
-        self.message = msg
-
-class InvalidAttributeRematcher(InvalidRematcher):
-    def __init__(self,
-                 msg: str= 'Couldn\'t construct attribute form line') -> None:
-        super().__init__()
-        self.message = msg
 
 class UpdatedDocError(Exception):
     """Rose when the script detects that the Afterbirth API doc structure
@@ -66,154 +24,216 @@ class UpdatedDocError(Exception):
         self.message = msg
 
 
+_basename = pth.basename
+
+
+def readDocFile(docFilePath: str) -> str:
+    """Returns the whole content of a doc file.
+
+    The file is read as bytes and decoded in one call rather than through
+    a text stream. Doxygen writes utf-8, which the platform default
+    encoding isn't on Windows."""
+    with open(docFilePath, 'rb') as docFile:
+        return docFile.read().decode('utf-8')
+
+
+# Many descriptions share the same doc link and short boilerplate texts,
+# those are interned so that all of them point to a single string.
+_LINK_CACHE = {} # type: Dict[str, str]
+INTERN_MAX_LENGTH = 64
+
+
 class DocDescription:
     """Holds the description and link to the documentation entry."""
     description = None #type: str
     link = None #type: Optional[str]
 
     def __init__(self, description: str, docLink: Optional[str]) -> None:
-        self.description = description
+        self.description = sys.intern(description) \
+                               if len(description) < INTERN_MAX_LENGTH \
+                               else description
+        self.link = _docUrl(docLink) if docLink else None
+
+
+def _docUrl(docLink: str) -> str:
+    """Returns the online doc url of the docLink file, cached by path."""
+    url = _LINK_CACHE.get(docLink)
+    if url is None:
         # TODO:
         # once https://github.com/atom/autocomplete-plus/pull/763 merged, use:
-        # self.link = 'file://' + docLink if docLink else None
+        # url = 'file://' + docLink
         # instead
-        self.link = 'https://moddingofisaac.com/docs/' + pth.basename(docLink)\
-                        if docLink else None
+        url = sys.intern('https://moddingofisaac.com/docs/'
+                         + _basename(docLink))
+        _LINK_CACHE[docLink] = url
+    return url
 
 
 class LuaType:
     """A simple lua type description.
-    The constructor provides means to interpolate the type from the docs."""
-    name = None #type: str
-    isConst = None #type: bool
-    isStatic = None #type: bool
+    The fromMatch constructor provides means to interpolate the type from
+    the docs."""
+    # The types, variables and functions below are created by the thousands,
+    # __slots__ spares each of them an instance __dict__.
+    __slots__ = ('name', 'isConst', 'isStatic')
 
     def __init__(self,
-                 typeHint: Union[Match, str]= None,
+                 name: str= 'nil',
                  isConst: bool= False,
                  isStatic: bool= False) -> None:
-        if typeHint is None:
-            self.__initFlat('nil')
-        elif not isinstance(typeHint, str):
-            self.__initFlat(
-                typeHint.group('type'),
-                tryMatch(typeHint, 'const'),
-                tryMatch(typeHint, 'static') )
-        else:
-            self.__initFlat(typeHint, isConst, isStatic)
-
-    def __initFlat(self,
-                   name: str='', isConst: bool= False, isStatic: bool= False):
         self.name = name if name != '' else 'nil' # type: str
         self.isConst = isConst # type: bool
         self.isStatic = isStatic # type: bool
 
+    @classmethod
+    def fromMatch(cls, typeMatcher: Optional[Match]) -> 'LuaType':
+        """Creates the type out of a match with a 'type' group, and optional
+        'const' and 'static' groups. No match gives the nil type."""
+        if typeMatcher is None:
+            return cls()
+        # the parameter pattern has no const and static groups
+        typeGroups = typeMatcher.groupdict()
+        return cls(typeGroups['type'],
+                   typeGroups.get('const') is not None,
+                   typeGroups.get('static') is not None )
+
 
 class LuaVariable:
     """A lua variable, inherited by classes describing attributes and other."""
-    name = None #type: str
-    luaType = None #type: LuaType
+    __slots__ = ('name', 'luaType')
 
     def __init__(self, name: str, luaType: LuaType) -> None:
-        self.luaType = luaType
+        self.luaType = luaType # type: LuaType
         if name == '':
             name = self.luaType.name
-        self.name = name
+        self.name = name # type: str
 
 
 class LuaParam(LuaVariable):
     """A parameter of a Lua function."""
-    def __init__(self, line: str) -> None:
-        """Initializes the parameter interpolating from line."""
-        paramMatcher = RE_FUNCTION_PARAMETER.search(line)
-        super().__init__(
-            tryMatchString(paramMatcher, 'name'),
-            LuaType(paramMatcher) )
+    __slots__ = ()
+
+    @classmethod
+    def fromMatch(cls, paramMatcher: Optional[Match]) -> 'LuaParam':
+        """Creates the parameter from a RE_FUNCTION_PARAMETERS match."""
+        if paramMatcher is None or paramMatcher.group('type') is None:
+            return cls('', LuaType()) # parameter list item without any type
+        return cls(paramMatcher.group('name') or '',
+                   LuaType.fromMatch(paramMatcher) )
 
 
 class LuaAttribute(LuaVariable):
     """An attribute of a Lua class.
-    The constructor can interpolate from the doc strings"""
-    # super()
-    description = None #type: DocDescription
-
-    def __init__(self, line: str) -> None:
-        """Initializes the attribute using a reg-exed line."""
-        attribScraper = RE_ATTRIBUTE.search(line)
-        name  = tryMatchNone(attribScraper, 'name')
-        if name is None:
-            raise InvalidAttributeRematcher()
-        self.name = name # type: str
+    The fromMatch constructor interpolates from the doc strings"""
+    __slots__ = ('description',)
+
+    def __init__(self,
+                 name: str,
+                 luaType: LuaType,
+                 description: Optional[DocDescription]= None) -> None:
+        super().__init__(name, luaType)
+        self.description = description # type: Optional[DocDescription]
+
+    @classmethod
+    def fromMatch(cls, lineMatcher: Match) -> 'LuaAttribute':
+        """Creates the attribute from an 'attribute' RE_CLASS_LINE match."""
         typeFetcher = RE_ATTRIBUTE_TYPE.search(
-            RE_HTML_REPLACER.sub('', attribScraper.group('type')))
-        self.luaType = LuaType(typeFetcher) # type: LuaType
+            stripHtmlTags(lineMatcher.group('attrType')))
+        return cls(lineMatcher.group('attrName'),
+                   LuaType.fromMatch(typeFetcher))
 
 
 class LuaFunction:
     """A structure to hold information about lua functions."""
-    name = None #type: str
-    description = None #type: DocDescription
-    parameters = [] #type: List[LuaParam]
-    returnType = None #type: LuaType
-
-    def __init__(self, arg: Union[Match, str]) -> None:
-        """Initializes a function with a re.Match object or a string
-        to parse."""
-        if not isinstance(arg, str):
-            arg = cast(Match, arg)
-            self.__initMatch(arg)
-        else:
-            self.__initLine(arg)
+    __slots__ = ('name', 'description', 'parameters', 'returnType')
 
-    def __initLine(self, line: str):
+    def __init__(self,
+                 name: str,
+                 parameters: Tuple[LuaParam, ...],
+                 returnType: LuaType,
+                 description: Optional[DocDescription]= None) -> None:
+        """Initializes a function out of its already parsed fields, use
+        the fromMatch and tryParse constructors to parse it."""
+        self.name = name # type: str
+        self.parameters = parameters # type: Tuple[LuaParam, ...]
+        self.returnType = returnType # type: LuaType
+        self.description = description # type: Optional[DocDescription]
+
+    @classmethod
+    def fromMatch(cls, functionRematcher: Match) -> 'LuaFunction':
+        """Creates the function from a RE_FUNCTION_SIGNATURE match
+        (or a 'function' RE_CLASS_LINE one)."""
+        return cls(*cls._signatureFields(functionRematcher))
+
+    @classmethod
+    def tryParse(cls, line: str) -> Optional['LuaFunction']:
+        """Returns the function described in line, None if there is none."""
         functionSignMatcher = RE_FUNCTION_SIGNATURE.search(line)
-        if functionSignMatcher is not None:
-            self.__initMatch(functionSignMatcher)
-        else:
-            raise InvalidFunctionRematcher()
-
-    def __initMatch(self, functionRematcher: Match):
-        if functionRematcher is None:
-            raise InvalidFunctionRematcher()
-        self.name = functionRematcher.group('name') # type: str
-        self._findParameters(functionRematcher.group('parameters'))
-        self._findReturnval(functionRematcher.group('returns'))
-
-    def _findParameters(self, paramMatchedVals: str):
-        """Finds the parameters and adds them to instance."""
-        if not paramMatchedVals: return
-        paramScraper = RE_HTML_REPLACER.sub('', paramMatchedVals).split(', ')
-        self.parameters = [LuaParam(param) for param in paramScraper if param]
-
-    def _findReturnval(self, retMatchval: str):
+        if functionSignMatcher is None:
+            return None
+        return cls.fromMatch(functionSignMatcher)
+
+    @staticmethod
+    def _signatureFields(functionRematcher: Match) \
+            -> Tuple[str, Tuple[LuaParam, ...], LuaType]:
+        """Returns the name, parameters and return type of a matched
+        function signature."""
+        return (functionRematcher.group('name'),
+                LuaFunction._findParameters(
+                    functionRematcher.group('parameters')),
+                LuaFunction._findReturnval(
+                    functionRematcher.group('returns')) )
+
+    @staticmethod
+    def _findParameters(paramMatchedVals: str) -> Tuple[LuaParam, ...]:
+        """Finds the parameters in paramMatchedVals."""
+        if not paramMatchedVals: return ()
+        paramList = stripHtmlTags(paramMatchedVals)
+        paramMatchers = RE_FUNCTION_PARAMETERS.finditer(paramList)
+        return tuple([LuaParam.fromMatch(paramMatcher)
+                      for paramMatcher in paramMatchers])
+
+    @staticmethod
+    def _findReturnval(retMatchval: str) -> LuaType:
         """Finds the function return value in retMatchval."""
         if not retMatchval:
-            self.returnType = LuaType() # type: LuaType
-        else:
-            returnMatcher = RE_FUNCTION_RETURNS.search(
-                RE_HTML_REPLACER.sub('', retMatchval))
-            self.returnType = LuaType(returnMatcher) # type: LuaType
+            return LuaType()
+        returnMatcher = RE_FUNCTION_RETURNS.search(stripHtmlTags(retMatchval))
+        return LuaType.fromMatch(returnMatcher)
 
 
 class LuaMethod(LuaFunction):
     """Extends lua functions to account for class constructors."""
-    def __init__(self, args: Union[Match, str], class_: 'LuaClass') -> None:
-        super().__init__(args)
-        if self.name == class_.name:
+    __slots__ = ()
+
+    def __init__(self,
+                 name: str,
+                 parameters: Tuple[LuaParam, ...],
+                 returnType: LuaType,
+                 class_: Optional['LuaClass']= None) -> None:
+        """Initializes a method, making it the constructor of class_ when
+        it shares its name. The inherited fromMatch and tryParse
+        constructors build a method without a class."""
+        super().__init__(name, parameters, returnType)
+        if class_ is not None and self.name == class_.name:
             self.returnType = LuaType(class_.name, isStatic= True)
             class_.constructor = self
 
+    @classmethod
+    def ofClass(cls, functionRematcher: Match,
+                class_: 'LuaClass') -> 'LuaMethod':
+        """Creates the method of class_ from a 'function' RE_CLASS_LINE
+        match (or a RE_FUNCTION_SIGNATURE one)."""
+        return cls(*cls._signatureFields(functionRematcher), class_=class_)
+
 
 def _parseDescription(line: str) -> Optional[str]:
     """Returns a string if it parsed a description in line.
     Returns None otherwise."""
-    try:
-        description = subHtmlFlags(
-            RE_DESCRIPTION.search(line).group(1).strip())
-    except AttributeError:
+    descriptionMatcher = RE_DESCRIPTION.search(line)
+    if descriptionMatcher is None:
         return None
-    else:
-        return description
+    return subHtmlFlags(descriptionMatcher.group(1).strip())
 
 
 class LuaClass:
@@ -227,46 +247,49 @@ class LuaClass:
 
     def __init__(self, classPath: str) -> None:
         """Initializes the class based on infos gathered in the class file."""
-        with open(classPath, 'r') as classFile:
-            content = classFile.read()
-            self.name = RE_CLASS_NAME.search(content).group(1) # type: str
-            self.description = DocDescription(self.name + ' instance',
-                                              classPath)
-            self._parentNames = [] # type: List[str]
-            self.attributes = [] # type: List[LuaAttribute]
-            self.methods = [] # type: List[LuaMethod]
-
-            # Currently, inheritance has no purpose.
-            inheritedMatcher = RE_INHERITS_FROM.search(content)
-            if inheritedMatcher is not None:
-                self._parentNames += [inheritedMatcher.group(1)]
-            del inheritedMatcher
-            del content
-
-            classFile.seek(0)
-            METHOD_SET = 1 #flags to decide to whome
-            ATTRIB_SET = 2 #the last description must
-            lastSet = 0 # be attributed
-            for curLine in classFile:
-                try: #try to find a function.
-                    self.methods += [LuaMethod(curLine, self)]
-                except InvalidFunctionRematcher: pass
-                else: lastSet = METHOD_SET
-
-                try: #try to find an attribute.
-                    self.attributes += [LuaAttribute(curLine)]
-                except InvalidAttributeRematcher: pass
-                else: lastSet = ATTRIB_SET
-
-                # finds description for previously found field of class
-                lineDescr = _parseDescription(curLine)
-                if lineDescr is not None:
-                    if lastSet == METHOD_SET:
-                        self.methods[-1].description = \
-                            DocDescription(lineDescr, classPath)
-                    elif lastSet == ATTRIB_SET:
-                        self.attributes[-1].description = \
-                            DocDescription(lineDescr, classPath)
+        content = readDocFile(classPath)
+        self.name = RE_CLASS_NAME.search(content).group(1) # type: str
+        self.description = DocDescription(self.name + ' instance',
+                                          classPath)
+        self._parentNames = [] # type: List[str]
+        self.attributes = [] # type: List[LuaAttribute]
+        self.methods = [] # type: List[LuaMethod]
+
+        # Currently, inheritance has no purpose.
+        inheritedMatcher = RE_INHERITS_FROM.search(content)
+        if inheritedMatcher is not None:
+            self._parentNames.append(inheritedMatcher.group(1))
+        del inheritedMatcher
+
+        METHOD_SET = 1 #flags to decide to whome
+        ATTRIB_SET = 2 #the last description must
+        lastSet = 0 # be attributed
+        lineSearch = RE_CLASS_LINE.search
+        addMethod = self.methods.append
+        addAttribute = self.attributes.append
+        for curLine in content.split('\n'):
+            # most lines are layout, only run the regex on member and
+            # description rows (doxygen class names, with doxygen's casing)
+            if 'memItemRight' not in curLine and 'mdescRight' not in curLine:
+                continue
+            lineMatcher = lineSearch(curLine)
+            if lineMatcher is None:
+                continue
+            matchKind = lineMatcher.lastgroup
+            if matchKind == 'function':
+                addMethod(LuaMethod.ofClass(lineMatcher, self))
+                lastSet = METHOD_SET
+            elif matchKind == 'attribute':
+                addAttribute(LuaAttribute.fromMatch(lineMatcher))
+                lastSet = ATTRIB_SET
+            else: # finds description for previously found field of class
+                lineDescr = subHtmlFlags(lineMatcher.group('text').strip())
+                if lastSet == METHOD_SET:
+                    self.methods[-1].description = \
+                        DocDescription(lineDescr, classPath)
+                elif lastSet == ATTRIB_SET:
+                    self.attributes[-1].description = \
+                        DocDescription(lineDescr, classPath)
 
 
 class LuaNamespace:
@@ -276,42 +299,48 @@ class LuaNamespace:
 
     def __init__(self, namespacePath: str) -> None:
         """Initializes the namespace descibed in the file namespacePath."""
-        with open(namespacePath, 'r') as namespaceFile:
-            content = namespaceFile.read()
-            try:
-                self.name = RE_NAMESPACE_NAME.search(content).group(1)
-            except AttributeError as e: #HACK: global functions are in global
-                if pth.basename(namespacePath) == 'group__funcs.html':
-                    self.name = '_G'
-                else:
-                    raise e
-            self.functions = [] # type: List[LuaFunction]
-            del content
-
-            namespaceFile.seek(0)
-            for curLine in namespaceFile:
-                try: #try to find a function
-                    self.functions += [LuaFunction(curLine)]
-                except InvalidFunctionRematcher: pass
-
+        content = readDocFile(namespacePath)
+        try:
+            self.name = RE_NAMESPACE_NAME.search(content).group(1)
+        except AttributeError as e: #HACK: global functions are in global
+            if pth.basename(namespacePath) == 'group__funcs.html':
+                self.name = '_G'
+            else:
+                raise e
+        self.functions = [] # type: List[LuaFunction]
+
+        addFunction = self.functions.append
+        for curLine in content.split('\n'):
+            # literal tests to skip the regexes on layout lines
+            if 'memItemRight' in curLine:
+                function = LuaFunction.tryParse(curLine)
+                if function is not None:
+                    addFunction(function)
+                    continue
+
+            if 'mdescRight' in curLine:
                 lineDescr = _parseDescription(curLine)
                 if lineDescr is not None:
                     self.functions[-1].description = \
                         DocDescription(lineDescr, None)
 
 
-EnumTag = NamedTuple('EnumTag', [
-    ('name', str),
-    ('value', int),
-    ('description', str)
-])
+class EnumTag:
+    """A member of a lua enumerator.
+
+    There are thousands of them, __slots__ keeps them small."""
+    __slots__ = ('name', 'value', 'description')
+
+    def __init__(self, name: str, value: int, description: str) -> None:
+        self.name = name # type: str
+        self.value = value # type: int
+        self.description = description # type: str
 
 
 class LuaEnumerator:
     """A lua enumerator, contains all its members."""
     name = None # type: str
     members = None # type: List[EnumTag]
-    streamInit = None # type: Callable[[IO],Optional[LuaEnumerator]]
     description = None # type: DocDescription
 
     def __init__(self, name: str, link: str, members: List[EnumTag]) -> None:
@@ -320,53 +349,60 @@ class LuaEnumerator:
         self.members = members
         self.description = DocDescription('Enum ' + name, link)
 
+    @classmethod
+    def streamInit(cls, openFile: BinaryIO) -> Optional['LuaEnumerator']:
+        """Reads the binary stream for a lua enumerator.
+
+        It will reads the stream untill it completes a LuaEnumerator,
+        it will then return it. Note that the IO pointer in argument will
+        be modified by this function.
+        The stream is binary since tell() is cheap on those, and only the
+        lines passing the literal tests need to be decoded."""
+        curMemberList = [] # type: List[EnumTag]
+        curEnumName = None # type: str
+        fileName = openFile.name
+        # bound methods hoisted out of the per-line loop
+        enumNameSearch = RE_ENUM_NAME.search
+        enumMemberSearch = RE_ENUM_MEMBER.search
+        addMember = curMemberList.append
 
-def __streamInit(openFile: IO) -> Optional[LuaEnumerator]:
-    """Reads the text stream for a lua enumerator.
-
-    It will reads the stream untill it completes a LuaEnumerator,
-    it will then return it. Note that the IO pointer in argument will
-    be modified by this function."""
-    curMemberList = [] # type: List[EnumTag]
-    curEnumName = None # type: str
-    fileName = openFile.name
-
-    oldPointerPosition = openFile.tell()
-    curLine = openFile.readline() # type: str
-    while curLine != '':
-        enumNameScraper = RE_ENUM_NAME.search(curLine)
-        if enumNameScraper is not None: # We find the enumerator specification
-            if curEnumName is None:
-                curEnumName = enumNameScraper.group('name')
-                curEnumLink = enumNameScraper.group('link')
-            else:
-                openFile.seek(oldPointerPosition) # unconsumes last line
-                return LuaEnumerator(curEnumName,
-                                     fileName + '#' + curEnumLink,
-                                     curMemberList)
-        else:
-            memberScraper = RE_ENUM_MEMBER.search(curLine)
-            if memberScraper is not None: # We find an enum field specification
-                descripString = tryMatchString(memberScraper, 'desc')
-                curMemberList += [EnumTag(
-                    memberScraper.group('name'),
-                    0, # the value enumTag field might be pertinent one day
-                    RE_HTML_REPLACER.sub('', descripString)
-                )]
         oldPointerPosition = openFile.tell()
-        curLine = openFile.readline()
-    # reached end of file
-    if curEnumName is not None:
-        return LuaEnumerator(curEnumName, curEnumLink, curMemberList)
-    else:
-        return None
-LuaEnumerator.streamInit = __streamInit # add the method to the class as static
+        curLine = openFile.readline() # type: bytes
+        while curLine != b'':
+            # literal tests to skip decoding and regexes on layout lines
+            enumNameScraper = enumNameSearch(curLine.decode('utf-8')) \
+                                  if b'memtitle' in curLine else None
+            if enumNameScraper is not None: # We find the enumerator spec
+                if curEnumName is None:
+                    curEnumName = enumNameScraper.group('name')
+                    curEnumLink = enumNameScraper.group('link')
+                else:
+                    openFile.seek(oldPointerPosition) # unconsumes last line
+                    return cls(curEnumName,
+                               fileName + '#' + curEnumLink,
+                               curMemberList)
+            elif b'fieldname' in curLine:
+                memberScraper = enumMemberSearch(curLine.decode('utf-8'))
+                if memberScraper is not None: # We find an enum field spec
+                    descripString = memberScraper.group('desc') or ''
+                    addMember(EnumTag(
+                        memberScraper.group('name'),
+                        0, # the value field might be pertinent one day
+                        stripHtmlTags(descripString)
+                    ))
+            oldPointerPosition = openFile.tell()
+            curLine = openFile.readline()
+        # reached end of file
+        if curEnumName is not None:
+            return cls(curEnumName, curEnumLink, curMemberList)
+        else:
+            return None
 
 
-def allDocFiles(docPath: str) -> Iterator[Tuple[str, str]]:
+def allDocFiles(docPath: str) -> Iterator['os.DirEntry']:
     """List all files in the docPath.
 
-    Returns their file name and associated directory paths.
+    Returns their directory entries, holding both file name and path.
     Note: currently the doc only has one level deep file organization,
     and this function only works if it is the case.
     If this ever came to change, this function needs update."""
@@ -375,33 +411,59 @@ def allDocFiles(docPath: str) -> Iterator[Tuple[str, str]]:
             try: assert dirEntry.name == 'search'
             except AssertionError: raise UpdatedDocError
 
-            for searchFile in os.scandir(dirEntry.path):
-                yield searchFile.name, dirEntry.path
+            yield from os.scandir(dirEntry.path)
         else:
-            yield dirEntry.name, docPath
+            yield dirEntry
+
+
+isClassFile = RE_CLASS_FILE.fullmatch # filter for class-description files
+isNamespaceFile = RE_NAMESPACE_FILE.fullmatch # and namespace-descripting ones
 
 
 def categorizeFiles(docPath: str) \
         -> Tuple[List[str], List[str], List[str], List[str]]:
     """Lists all pertinent files in the documentation.
     Returns: class-files, namespace-files, enumerator-files"""
-
-    def isClassFile(name: str) -> bool: #filter for class-description files
-        """Returns True if name matches a class description file."""
-        return re.fullmatch(r'class_[0-9A-Za-z_]*(?!-members.html)\.html',
-                            name) is not None
-    def isNamespaceFile(name: str) -> bool:
-        """Filter for namespace descripting files."""
-        return re.fullmatch(r'namespace_[\w]+\.html', name) is not None
+    classFiles = [] # type: List[str]
+    namespaceFiles = [] # type: List[str]
+    for curFile in allDocFiles(docPath): # single pass over the doc
+        if isClassFile(curFile.name):
+            classFiles.append(curFile.path)
+        elif isNamespaceFile(curFile.name):
+            namespaceFiles.append(curFile.path)
     return (
-        [pth.join(curDir, curFile) for curFile, curDir in allDocFiles(docPath)
-                                   if isClassFile(curFile)],
-        [pth.join(curDir, curFile) for curFile, curDir in allDocFiles(docPath)
-                                   if isNamespaceFile(curFile)],
+        classFiles,
+        namespaceFiles,
         [pth.join(docPath, 'group__enums.html')],
         [pth.join(docPath, 'group__funcs.html')] )
 
 
+ENUM_BUFFER_SIZE = 64 * 1024
+# Below this amount of class and namespace files, spawning worker processes
+# costs more than it saves.
+PARALLEL_MIN_FILES = 8
+PARALLEL_CHUNKSIZE = 8
+# ProcessPoolExecutor refuses more workers than this on Windows.
+WINDOWS_MAX_WORKERS = 61
+
+
+def _newExecutor(fileCount: int) -> Optional[ProcessPoolExecutor]:
+    """Returns a process pool sized for fileCount files.
+    Returns None when the files should be parsed serially: too few files,
+    a single CPU, or a host that cannot create a process pool."""
+    # With a single CPU, the workers only add pickling overhead.
+    cpuCount = os.cpu_count() or 1
+    if fileCount < PARALLEL_MIN_FILES or cpuCount < 2:
+        return None
+    maxWorkers = min(cpuCount, fileCount)
+    if sys.platform == 'win32':
+        maxWorkers = min(maxWorkers, WINDOWS_MAX_WORKERS)
+    try:
+        return ProcessPoolExecutor(max_workers=maxWorkers)
+    except (NotImplementedError, OSError): # no working sem_open
+        return None
+
+
 class AfterbirthApi:
     """Holds all the informations about the API."""
     classes = [] # type: List[LuaClass]
@@ -411,15 +473,29 @@ class AfterbirthApi:
     def __init__(self, docPath: str) -> None:
         classFiles, nsFiles, enumFiles, funFiles = categorizeFiles(docPath)
 
-        self.classes = [LuaClass(f) for f in classFiles]
-        self.namespaces = [LuaNamespace(f) for f in nsFiles + funFiles]
+        nsFiles += funFiles
+
+        # Each file is parsed independently, so they are spread over
+        # processes (the parsing is CPU bound, threads wouldn't help).
+        executor = _newExecutor(len(classFiles) + len(nsFiles))
+        if executor is None:
+            self.classes = [LuaClass(f) for f in classFiles]
+            self.namespaces = [LuaNamespace(f) for f in nsFiles]
+        else:
+            with executor:
+                self.classes = list(executor.map(
+                    LuaClass, classFiles, chunksize=PARALLEL_CHUNKSIZE))
+                self.namespaces = list(executor.map(
+                    LuaNamespace, nsFiles, chunksize=PARALLEL_CHUNKSIZE))
+        self.enumerators = [] # type: List[LuaEnumerator]
         for curFile in enumFiles:
-            with open(curFile, 'r') as enumStream:
+            # the enum file is streamed, a bigger buffer cuts down the reads
+            with open(curFile, 'rb', buffering=ENUM_BUFFER_SIZE) as enumStream:
                 while True: #do while, breaks when reached end of stream
                     curEnum = LuaEnumerator.streamInit(enumStream)
                     if curEnum is None:
                         break
-                    self.enumerators += [curEnum]
+                    self.enumerators.append(curEnum)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,16 @@
 #pylint: disable=all
 
+import functools
 import re
 
+# scraper.py star-imports this module, only export the patterns and helpers
+__all__ = [
+    'RE_CLASS_NAME', 'RE_NAMESPACE_NAME', 'RE_INHERITS_FROM',
+    'RE_FUNCTION_SIGNATURE', 'RE_FUNCTION_RETURNS', 'RE_FUNCTION_PARAMETERS',
+    'RE_ATTRIBUTE_TYPE', 'RE_ENUM_NAME', 'RE_ENUM_MEMBER', 'RE_DESCRIPTION',
+    'RE_CLASS_LINE', 'RE_HTML_REPLACER', 'RE_CLASS_FILE', 'RE_NAMESPACE_FILE',
+    'stripHtmlTags', 'subHtmlFlags' ]
+
 
 _reic = re.IGNORECASE
 
@@ -21,9 +30,9 @@ r"inherited from <a.+?>(.+?)</a>",
 _reic)
 
 
-RE_FUNCTION_SIGNATURE =re.compile(
-r"(?:<td class=\"memitemleft\".+?>(?P<returns>.+?))?&#.+?;</td><td class=\"memitemright\".+?><a.+?>(?P<name>.+?)</a>\s+\((?P<parameters>.+?)?\)",
-_reic)
+_FUNCTION_SIGNATURE =\
+r"(?:<td class=\"memitemleft\".+?>(?P<returns>.+?))?&#.+?;</td><td class=\"memitemright\".+?><a.+?>(?P<name>.+?)</a>\s+\((?P<parameters>.+?)?\)"
+RE_FUNCTION_SIGNATURE =re.compile(_FUNCTION_SIGNATURE, _reic)
 
 
 RE_FUNCTION_RETURNS =re.compile(
@@ -31,16 +40,24 @@ r"(?:(?:(?P<const>const)\s*)?(?:(?P<static>static)\s*)?)*(?:(?P<type>[_a-z][_a-z
 _reic)
 
 
-RE_FUNCTION_PARAMETER =re.compile(
-r"(?P<type>([_a-z][_a-z0-9]*(?:::[_a-z][_a-z0-9]*)*))(?:\s+(?P<name>[_a-z][_a-z0-9]*))?",
-_reic)
+_FUNCTION_PARAMETER =\
+r"(?P<type>([_a-z][_a-z0-9]*(?:::[_a-z][_a-z0-9]*)*))(?:\s+(?P<name>[_a-z][_a-z0-9]*))?"
 
 
-RE_ATTRIBUTE =re.compile(
-r"<td class=\"memitemleft\".+?>(?P<type>.+?)&#.+?;</td><td class=\"memitemright\".+?><a.+?>(?P<name>.+?)</a>",
+#Walks a whole ', ' separated parameter list with finditer: each match is
+#the first _FUNCTION_PARAMETER match in one non-empty item of the list, the
+#type group being None when the item holds no type.
+RE_FUNCTION_PARAMETERS =re.compile(
+r"(?:^|, )(?!, |\Z)(?:(?:(?!, ).)*?" + _FUNCTION_PARAMETER + r")?",
 _reic)
 
 
+#Takes the group names, which must differ from the function pattern's ones
+#in RE_CLASS_LINE
+_ATTRIBUTE_TEMPLATE =\
+r"<td class=\"memitemleft\".+?>(?P<{type}>.+?)&#.+?;</td><td class=\"memitemright\".+?><a.+?>(?P<{name}>.+?)</a>"
+
+
 RE_ATTRIBUTE_TYPE =re.compile(
 r"(?:(?:(?P<const>const)\s*)?(?:(?P<static>static)\s*)?)*(?:(?P<type>[_a-z][_a-z0-9]*(?:::[_a-z][_a-z0-9]*)*))(?:\s+&amp;)?",
 _reic)
@@ -56,14 +73,42 @@ r"<td class=\"fieldname\"><a.+?</a>(?P<name>.+?)&#.+?<td class=\"fielddoc\">(?:<
 _reic)
 
 
-RE_DESCRIPTION = re.compile(r"<td class=\"mdescright\">(.+?)<a.+?</td>",
+_DESCRIPTION = r"<td class=\"mdescright\">(?P<text>.+?)<a.+?</td>"
+RE_DESCRIPTION = re.compile(_DESCRIPTION, _reic)
+
+
+#The three patterns a class file line is checked against, fused in a single
+#alternation. The matching one is given by the lastgroup of the match.
+#Attribute groups get other names since group names must be unique.
+RE_CLASS_LINE =re.compile(
+r"(?P<function>" + _FUNCTION_SIGNATURE + r")"
+r"|(?P<attribute>"
++ _ATTRIBUTE_TEMPLATE.format(type='attrType', name='attrName') + r")"
+r"|(?P<description>" + _DESCRIPTION + r")",
 _reic)
 
 RE_HTML_REPLACER = re.compile(r"<.*?>")
 
+#File name patterns used to sort the doc files
+RE_CLASS_FILE = re.compile(r"class_[0-9A-Za-z_]*(?!-members\.html)\.html")
 
+RE_NAMESPACE_FILE = re.compile(r"namespace_[\w]+\.html")
+
+
+def stripHtmlTags(toStrip: str) -> str:
+    """Returns toStrip without its html tags.
+
+    Most type and parameter strings hold no tag at all, the '<' test
+    skips the regex engine for them."""
+    return RE_HTML_REPLACER.sub('', toStrip) if '<' in toStrip else toStrip
+
+
+@functools.lru_cache(maxsize=4096)
 def subHtmlFlags(toReplace: str) -> str:
     """Returns a version of the string where html tags are replaced
-    by their plaintext equivalent."""
-    ret = RE_HTML_REPLACER.sub('', toReplace)
+    by their plaintext equivalent.
+
+    Cached: inherited members are documented again in each subclass page,
+    so the same descriptions come up many times."""
+    ret = stripHtmlTags(toReplace)
     return ret.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;','>')